@@ -1,3 +1,4 @@
+import numpy as np
 import pandas as pd
 
 
@@ -22,19 +23,35 @@ def dhondt(
     pandas.DataFrame:
         Summary with the seats of each party.
     """
-    output = []
-    for __party__, df_tmp in input_df.groupby(party):
-        __votes__ = df_tmp[votes].values[0]
-        for i in range(n_seats):
-            output.append({
-                party: __party__,
-                "quota": __votes__ / (i + 1)
-            })
-
-    tmp = pd.DataFrame(output).sort_values(
-        "quota", ascending=False).reset_index(drop=True)
+    party_votes = input_df.groupby(party)[votes].first()
+    names = party_votes.index.to_numpy()
+    v = party_votes.to_numpy(dtype=np.float64)
 
     if quota:
-        return tmp, tmp.loc[n_seats - 1, "quota"]
+        flat = (v[:, None] / np.arange(1, n_seats + 1)).ravel()
+        order = np.argsort(-flat, kind="stable")
 
-    return tmp.head(n_seats).groupby(party).count().reset_index().rename(columns={"quota": "seats"}).sort_values("seats", ascending=False)
+        tmp = pd.DataFrame({
+            party: np.repeat(names, n_seats)[order],
+            "quota": flat[order]
+        })
+
+        return tmp, flat[order[n_seats - 1]]
+
+    # D'Hondt never gives a party less than the integer part of its
+    # proportional share, so only the few seats left over need ranking.
+    seats = np.zeros(len(v), dtype=np.int64)
+    if v.sum() > 0:
+        seats = np.floor(n_seats * v / v.sum()).astype(np.int64)
+    remaining = n_seats - seats.sum()
+
+    if remaining > 0:
+        # Next `remaining` quotas of each party; the largest ones win
+        quotas = v[:, None] / (seats[:, None] + np.arange(1, remaining + 1))
+        top = np.argsort(-quotas.ravel(), kind="stable")[:remaining]
+        seats += np.bincount(top // remaining, minlength=len(v))
+
+    won = np.flatnonzero(seats)
+    won = won[np.argsort(-seats[won], kind="stable")]
+
+    return pd.DataFrame({party: names[won], "seats": seats[won]})
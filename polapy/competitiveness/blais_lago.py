@@ -12,27 +12,37 @@ def blais_lago(
     n_seats=1,
     system="dhondt"
 ):
+    vote_counts = input_df[votes].to_numpy()
+    total_votes = np.nansum(vote_counts)
+
     if system == "dhondt":
         data, quot = dhondt(input_df, party=candidate,
                             votes=votes, n_seats=n_seats, quota=True)
-        seats = dhondt(input_df, party=candidate, votes=votes,
-                       n_seats=n_seats, quota=False)
+        seats = data.head(n_seats).groupby(candidate).size()\
+            .reset_index(name="seats")
 
         data["distance"] = data["quota"] - quot
-        n_seats = data[data["distance"] >= 0]
+        winners = data[data["distance"] >= 0]
         data = data[data["distance"] < 0]
 
-        data["distance"] = data["quota"] - data.apply(
-            lambda x: n_seats[n_seats[candidate] != x[candidate]]["quota"].min(), axis=1)
-        data["distance"] *= -1
-
-        output_df = pd.merge(
-            data.groupby(candidate).agg({"distance": "min"}).reset_index(),
-            seats,
-            on=candidate,
-            how="outer"
-        )
-        output_df["seats"] = output_df["seats"].fillna(0) + 1
+        # Lowest winning quota held by a party other than the row's own
+        winner_min = winners.groupby(candidate)["quota"].min().sort_values()
+        lowest = winner_min.iloc[0]
+        runner_up = winner_min.iloc[1] if len(winner_min) > 1 else np.nan
+        other_min = np.where(
+            data[candidate].to_numpy() == winner_min.index[0], runner_up, lowest)
+
+        data["distance"] = other_min - data["quota"]
+
+        distance = data.groupby(candidate)["distance"].min()
+        seat_counts = seats.set_index(candidate)["seats"]
+        parties = distance.index.union(seat_counts.index)
+
+        output_df = pd.DataFrame({
+            candidate: parties,
+            "distance": distance.reindex(parties).to_numpy(),
+            "seats": seat_counts.reindex(parties, fill_value=0).to_numpy() + 1
+        })
         output_df["seats"] = output_df["distance"] * output_df["seats"]
 
         output_df = output_df.sort_values("seats", ascending=False)
@@ -42,19 +52,12 @@ def blais_lago(
         seats = proportional(input_df, candidate=candidate,
                              votes=votes, method=system, n_seats=n_seats)
         q = quota(method=system,
-                  n_votes=input_df[votes].sum(), n_seats=n_seats)
-        data = input_df.copy()
-        data["quota"] = q
-
-        output_df = pd.merge(
-            data,
-            seats,
-            on=candidate,
-            how="outer"
-        )
-
-        output_df["seats"] = output_df["seats"].fillna(
-            0).apply(lambda x: (2*x + 1)/2 + 0.001)
+                  n_votes=total_votes, n_seats=n_seats)
+        # Left join keeps every column the allocator returns
+        output_df = input_df.assign(quota=q).join(
+            seats.set_index(candidate), on=candidate)
+
+        output_df["seats"] = (2*output_df["seats"].fillna(0) + 1)/2 + 0.001
         output_df["seats"] = q * output_df["seats"] - output_df[votes]
 
         output_df = output_df.sort_values("seats", ascending=False)
@@ -62,8 +65,8 @@ def blais_lago(
 
     elif system == "smp":
         output_df = input_df.copy()
-        output_df["seats"] = input_df[votes].max() - output_df[votes]
+        output_df["seats"] = np.nanmax(vote_counts) - vote_counts
 
-    output_df["value"] = output_df["seats"] / (input_df[votes].sum()/n_seats)
+    output_df["value"] = output_df["seats"] / (total_votes / n_seats)
 
     return output_df["value"].sum(), output_df
@@ -9,45 +9,51 @@ def election_competitiveness(
     votes: str = "votes",
     score: str = "score"
 ) -> (float, pd.DataFrame):
-    data = data.copy()
+    if data.duplicated([candidate, unit]).any():
+        raise ValueError("Index contains duplicate entries, cannot reshape")
 
     if score not in list(data):
-        data[score] = data.groupby(unit, group_keys=False)[votes]\
-            .apply(lambda x: x/x.sum())
-
-    values = data.pivot(
-        index=candidate,
-        columns=unit,
-        values=votes
-    )
-    rates = data.pivot(
-        index=candidate,
-        columns=unit,
-        values=score
-    )
-
-    output = []
-
-    for candidate in rates.index:
-        N_candidates = rates.shape[0]
-        rates_c = rates[rates.index == candidate]
-        values_c = values[values.index == candidate]
-
-        xx = np.tile(rates_c, reps=(N_candidates, 1))
-        yy = np.tile(values_c, reps=(N_candidates, 1))
-
-        between = np.multiply(yy, (1 - np.absolute(xx - rates)))
-        between = between[between.index != candidate]
-
-        dv_between = 0 if np.sum(values_c).sum() == 0 else np.sum(
-            between).sum() / (N_candidates * (N_candidates - 1) * np.sum(values_c).sum())
-
-        output.append({
-            "candidate": candidate,
-            "antagonism": dv_between
+        data = data.assign(**{
+            score: data[votes] / data.groupby(unit)[votes].transform("sum")
         })
 
-    df_between = pd.DataFrame(output)
+    # Candidate x unit matrices; pairs absent from data stay NaN. As with
+    # pivot, a missing candidate or unit is kept as its own row or column.
+    cand_codes, candidates = pd.factorize(
+        data[candidate], sort=True, use_na_sentinel=False)
+    unit_codes, units = pd.factorize(data[unit], use_na_sentinel=False)
+
+    R = np.full((len(candidates), len(units)), np.nan)
+    V = np.full((len(candidates), len(units)), np.nan)
+    R[cand_codes, unit_codes] = data[score].to_numpy()
+    V[cand_codes, unit_codes] = data[votes].to_numpy()
+    N_candidates = R.shape[0]
+
+    totals = np.nansum(V, axis=1)
+    dv_between = np.zeros(N_candidates)
+
+    # Candidates without votes have no antagonism; only the others need a
+    # slice of the closeness tensor.
+    active = np.flatnonzero(totals != 0)
+
+    # closeness[i, j, u]: how close i and j perform in u. Votes only depend
+    # on (i, u), so rivals are summed out before weighting. Candidates are
+    # processed in blocks to keep the tensor at about 2**24 entries.
+    block = max(1, 2**24 // max(R.size, 1))
+    for start in range(0, len(active), block):
+        rows = active[start:start + block]
+
+        closeness = 1 - np.absolute(R[rows, None, :] - R[None, :, :])
+        closeness[np.arange(len(rows)), rows] = 0
+        between = np.nansum(V[rows] * np.nansum(closeness, axis=1), axis=1)
+
+        dv_between[rows] = between / \
+            (N_candidates * (N_candidates - 1) * totals[rows])
+
+    df_between = pd.DataFrame({
+        "candidate": candidates,
+        "antagonism": dv_between
+    })
     value = df_between["antagonism"].sum()
 
     return value, df_between
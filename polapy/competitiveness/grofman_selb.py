@@ -1,4 +1,5 @@
 from polapy.aggregate import dhondt
+import numpy as np
 import pandas as pd
 
 
@@ -13,8 +14,8 @@ def grofman_selb(
 
     data, quot = dhondt(input_df, party=candidate,
                         votes=votes, n_seats=n_seats, quota=True)
-    seats = dhondt(input_df, party=candidate, votes=votes,
-                   n_seats=n_seats, quota=False)
+    seats = data.head(n_seats).groupby(candidate).size()\
+        .reset_index(name="seats")
     data["distance"] = data["quota"] - quot
 
     frag = data[data["distance"] < 0]
@@ -27,30 +28,29 @@ def grofman_selb(
     )
     lose_seat = pd.merge(lose_seat, input_df, on=candidate)
 
-    def get_loss(x):
-        frag = lose_seat[lose_seat[candidate] != x[candidate]]
-        curr = lose_seat[lose_seat[candidate] == x[candidate]]
-        s = list(curr["seats"])[0]
-        v = list(curr[votes])[0]
+    s = lose_seat["seats"].to_numpy(dtype=np.float64)
+    v = lose_seat[votes].to_numpy(dtype=np.float64)
 
-        frag["den"] = (frag["seats"] + 1) + s
-        frag["num"] = (frag["seats"] + 1) * v - s * lose_seat[votes]
-        frag["value"] = frag["num"] / frag["den"]
-
-        return frag["value"].min()
+    # loss[i, j]: votes i can lose before its last seat goes to j
+    loss = ((s[None, :] + 1) * v[:, None] - s[:, None] * v[None, :]) / \
+        ((s[None, :] + 1) + s[:, None])
+    np.fill_diagonal(loss, np.inf)
+    loss = loss.min(axis=1, initial=np.inf)
+    loss[np.isinf(loss)] = np.nan
 
     input_lose = data.groupby(candidate).agg({"quota": "min"}).reset_index()
-    input_lose["lose"] = input_lose.apply(lambda x: get_loss(x), axis=1)
+    input_lose["lose"] = input_lose[candidate].map(
+        pd.Series(loss, index=lose_seat[candidate]))
 
     input_gain = pd.merge(input_df, seats, on=candidate, how="outer").fillna(0)
-    input_gain["gain"] = input_gain.apply(lambda x: (
-        (1 + x["seats"])/(n_seats + 1)) - x[votes], axis=1)
+    input_gain["gain"] = (1 + input_gain["seats"])/(n_seats + 1) - \
+        input_gain[votes]
 
     output = pd.merge(input_gain, input_lose, on=candidate)
-    output["competition"] = output.apply(lambda x: max(
-        (T_e - x["gain"]), (T_e - x["lose"])), axis=1) / T_e
+    output["competition"] = np.fmax(
+        T_e - output["gain"], T_e - output["lose"]) / T_e
 
     # Index of Competition, C
-    C = (output["competition"] * output[votes]).sum()
+    C = np.dot(output["competition"].to_numpy(), output[votes].to_numpy())
 
     return C, output
@@ -1,6 +1,17 @@
+import numpy as np
+
+
 def laackso_taagepera(
     input_df,
     share="share",
     alpha=2
 ):
-    return (input_df[share].apply(lambda x: x**alpha).sum())**(1/(1 - alpha))
+    shares = input_df[share].to_numpy(dtype=np.float64)
+    shares = shares[~np.isnan(shares)]
+
+    if alpha == 2:
+        total = np.dot(shares, shares)
+    else:
+        total = np.power(shares, alpha).sum()
+
+    return total**(1/(1 - alpha))
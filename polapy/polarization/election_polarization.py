@@ -27,51 +27,48 @@ def election_polarization(
     pd.DataFrame
         A DataFrame with the antagonism of each candidate
     """
-    data = data.copy()
-
-    values = data.pivot(
-        index=candidate,
-        columns=unit,
-        values=votes
-    )
+    if data.duplicated([candidate, unit]).any():
+        raise ValueError("Index contains duplicate entries, cannot reshape")
 
     if score not in list(data):
-        data[score] = data.groupby(unit, group_keys=False)[votes]\
-            .apply(lambda x: x/x.sum())
+        data = data.assign(**{
+            score: data[votes] / data.groupby(unit)[votes].transform("sum")
+        })
+
+    codes, candidates = pd.factorize(data[candidate], sort=True)
+    vote_counts = data[votes].fillna(0).to_numpy(dtype=np.float64)
+    scores = data[score].to_numpy()
 
     # Gets total of votes and candidates
     N_candidates = len(data[candidate].unique())
-    total = values.sum().sum()
-
-    def get_average(x, total=1):
-        return x[votes].sum() / total
-
-    df_mean = data.groupby(candidate)\
-        .apply(lambda x: get_average(x, total=total))\
-        .reset_index().rename(columns={0: "weight"})
-
-    xx = np.sum(values).reset_index().rename(columns={0: "total"})
-
-    df_within = pd.merge(data, df_mean, on=candidate)
-    df_within = pd.merge(df_within, xx, on=unit)
-
-    df_within["diff_abs"] = np.absolute(df_within[score] - df_within["weight"])
-    df_within["total"] = df_within[votes] * df_within["diff_abs"]
-
-    df_within = df_within.groupby(candidate).agg(
-        {"total": "sum"}) / (N_candidates - 1)
-
-    df_sum = data.groupby(candidate).agg(
-        {votes: "sum"}).reset_index().rename(columns={votes: "total_votes"})
-
-    df_within = pd.merge(df_within, df_sum, on=candidate)
-    df_within = df_within.rename(
-        columns={"total": votes, votes: "weight"}
-    )
-    df_within[votes] = df_within.apply(
-        lambda x: x[votes] / x["total_votes"] if x["total_votes"] > 0 else 0, axis=1)
-    df_within = df_within.drop(columns=["total_votes"])
-
-    value = df_within[votes].sum()
-
-    return value, df_within.rename(columns={votes: "antagonism"})
+    total = vote_counts.sum()
+
+    # Rows without a candidate count towards the totals above only
+    known = codes >= 0
+    codes, vote_counts, scores = codes[known], vote_counts[known], scores[known]
+
+    total_votes = np.bincount(
+        codes, weights=vote_counts, minlength=len(candidates))
+    weight = total_votes / total
+
+    # Accumulate votes * |score - weight| per candidate in a single pass
+    within = vote_counts * np.absolute(scores - weight[codes])
+    within = np.bincount(
+        codes,
+        weights=np.where(np.isnan(within), 0, within),
+        minlength=len(candidates)
+    ) / (N_candidates - 1)
+
+    df_within = pd.DataFrame({
+        candidate: candidates,
+        "antagonism": np.divide(
+            within,
+            total_votes,
+            out=np.zeros(len(candidates)),
+            where=total_votes > 0
+        )
+    })
+
+    value = df_within["antagonism"].sum()
+
+    return value, df_within
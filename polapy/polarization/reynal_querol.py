@@ -1,8 +1,11 @@
-import pandas as pd
+import numpy as np
 
 
 def reynal_querol(
     input_df,
     rate="rate"
 ):
-    return 1 - (input_df[rate].apply(lambda x: (((0.5 - x)/0.5)**2 * x))).sum()
+    rates = input_df[rate].to_numpy(dtype=np.float64)
+    distance = (0.5 - rates)/0.5
+
+    return 1 - np.nansum(distance * distance * rates)
@@ -1,5 +1,4 @@
 import numpy as np
-import pandas as pd
 
 
 def wang_tsui(
@@ -9,11 +8,15 @@ def wang_tsui(
     value="value",
     rate="rate"
 ):
-    median = np.median(input_df["rate"])
-    population = np.sum(input_df["value"])
+    rates = input_df[rate].to_numpy(dtype=np.float64)
+    values = input_df[value].to_numpy(dtype=np.float64)
 
-    value = 0
-    for i, xx in input_df.iterrows():
-        value += xx.value * np.absolute((xx.rate - median)/median) ** gamma
+    median = np.median(rates)
+    deviation = np.absolute((rates - median)/median)
 
-    return K * value / population
+    if gamma == 0.5:
+        deviation = np.sqrt(deviation)
+    else:
+        deviation = deviation ** gamma
+
+    return K * np.dot(values, deviation) / values.sum()